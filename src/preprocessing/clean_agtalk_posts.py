@@ -6,7 +6,6 @@ Description:
 
 Cleans:
     - Fixes encoding artifacts
-    - Removes dates and timestamps from text
     - Removes URLs from text
     - Removes attatchment references from text
     - Normalizes whitespace
@@ -16,18 +15,76 @@ Cleans:
 
 # Standard Library Imports
 
+import multiprocessing as mp
+import os
 import re
 
 # Third-Party Imports
 
+import numpy as np
 import pandas as pd
 
+# Preferring Google's RE2 engine (linear-time DFA, no backtracking) for
+# the fused patterns; falling back to the stdlib engine when absent
+
+try:
+    import re2 as _regex_engine
+except ImportError:
+    _regex_engine = re
+
 # File Paths
 
 INPUT_PATH = "data/raw/precision_talk_2021_2026.csv"
 
 OUTPUT_PATH = "data/processed/precision_talk_five_year_cleaned.csv"
 
+# Rows processed per streaming chunk
+
+CHUNK_SIZE = 50_000
+
+# Fused removal pattern so each string is scanned once instead of
+# once per artifact type
+
+_CLEAN_RE = _regex_engine.compile(
+    # Dates/timestamps no longer appear in post bodies: the spider parses
+    # them into post_timestamp instead of leaving header text in place
+    r"http\S+|www\S+"                                # URLs
+    r"|Edited by .*"                                 # edit metadata
+    r"|Attachments.*"                                # attachment metadata
+    r"|\S+\.(?:jpg|jpeg|png|pdf)"                    # image/file references
+    r"|\d+KB\s*-\s*\d+\s*downloads"                  # download counters
+    r"|\(.*?full\)\."                                # full-size image notes
+)
+
+# Fused spacing pattern; replacement depends on which branch matched
+
+_SPACING_RE = _regex_engine.compile(r"\s+\)|\(\s+|\s+")
+
+
+def _spacing_repl(match) -> str:
+
+    """
+    Collapses whitespace and fixes spacing around parentheses
+    """
+
+    text = match.group(0)
+    if text.endswith(")"):
+        return ")"
+    if text.startswith("("):
+        return "("
+    return " "
+
+
+def _clean_single(text: str) -> str:
+
+    """
+    Runs the fused removal, artifact, and spacing passes on one string
+    """
+
+    text = _CLEAN_RE.sub("", text)
+    text = text.replace("‚Äô", "'")
+    return _SPACING_RE.sub(_spacing_repl, text).strip()
+
 
 
 # Raw Data Cleaning Function
@@ -38,68 +95,78 @@ def clean_text_column(series: pd.Series) -> pd.Series:
     Applies text normalization and data cleaning to raw post text
     """
 
-    
-    # Ensuring text type
 
-    series = series.astype(str)
+    # Fixing encoding artifacts (vectorized; stays in pandas' C path)
 
-    # Fixing encoding artifacts
-
-    series = series.apply(
-        lambda x: x.encode("latin1", errors="ignore").decode("utf-8", errors="ignore")
+    series = (
+        series.str.encode("latin1", errors="ignore")
+        .str.decode("utf-8", errors="ignore")
     )
 
-    # Removing dates and timestamps from text
+    # Applying the fused removal/artifact/spacing passes at NumPy level;
+    # RE2 patterns cannot be handed to pandas' str.replace directly
 
-    series = series.str.replace(
-        r"\b\d{1,2}/\d{1,2}/\d{2,4}\s*\d{0,2}:?\d{0,2}", "", regex=True
-    )
-    series = series.str.replace(
-        r"\b\d{1,2}:\d{2}\b", "", regex=True
-    )
+    cleaned = np.frompyfunc(_clean_single, 1, 1)(series.to_numpy())
 
-    # Removing URLs from text
+    return pd.Series(cleaned, index=series.index, dtype="string[pyarrow]")
 
-    series = series.str.replace(
-        r"http\S+|www\S+", "", regex=True
-    )
 
-    # Removing common metadata artifacts from text
+# Parallel Cleaning Wrapper
 
-    series = series.str.replace(r"Edited by .*", "", regex=True)
-    series = series.str.replace(r"Attachments.*", "", regex=True)
+def clean_text_column_parallel(series: pd.Series, pool=None) -> pd.Series:
 
-    # Removing image/file references from text
+    """
+    Splits the series across CPU cores and cleans each slice in parallel
 
-    series = series.str.replace(r"\S+\.(jpg|jpeg|png|pdf)", "", regex=True)
-    series = series.str.replace(r"\d+KB\s*-\s*\d+\s*downloads", "", regex=True)
-    series = series.str.replace(r"\(.*?full\)\.", "", regex=True)
+    Each row is independent, so the regex-bound cleaning stage scales
+    near-linearly with worker count. The caller owns the pool so it can
+    be reused across streaming chunks
+    """
 
-    # Fixing known encoding artifact
+    n_workers = os.cpu_count() or 1
 
-    series = series.str.replace("‚Äô", "'", regex=False)
+    # Worker dispatch overhead is not worth it for small slices
 
-    # Cleaning spacing artifacts
+    if pool is None or n_workers == 1 or len(series) < 10_000:
+        return clean_text_column(series)
 
-    series = series.str.replace(r"\s+\)", ")", regex=True)
-    series = series.str.replace(r"\(\s+", "(", regex=True)
+    # Splitting by integer position; np.array_split on a Series goes
+    # through deprecated swapaxes dispatch and breaks on pandas 3.x
 
-    # Normalizing whitespace
+    bounds = np.array_split(np.arange(len(series)), n_workers)
+    slices = [series.iloc[b[0]:b[-1] + 1] for b in bounds if len(b)]
 
-    series = series.str.replace(r"\s+", " ", regex=True).str.strip()
+    parts = pool.map(clean_text_column, slices)
 
-    return series
+    return pd.concat(parts)
 
 
 # main block
 
 if __name__ == "__main__":
-    df = pd.read_csv(INPUT_PATH)
 
-    df["clean_text"] = clean_text_column(df["post_text"])
+    # Streaming the CSV in chunks keeps peak memory at O(chunk) instead
+    # of holding the full corpus plus cleaning intermediates; one worker
+    # pool is forked up front and reused for every chunk
 
-    # Remove short posts
-    
-    df = df[df["clean_text"].str.len() >= 20]
+    with mp.Pool(os.cpu_count() or 1) as pool, \
+            pd.read_csv(INPUT_PATH, chunksize=CHUNK_SIZE) as reader, \
+            open(OUTPUT_PATH, "w", encoding="utf-8", newline="") as out:
+
+        for i, chunk in enumerate(reader):
+
+            # Arrow-backed strings: contiguous UTF-8 storage and C++ .str kernels
+
+            chunk["post_text"] = chunk["post_text"].astype("string[pyarrow]")
+
+            # Dropping short raw posts before they pay the cleaning cost
+
+            chunk = chunk[chunk["post_text"].str.len().fillna(0).to_numpy() >= 20]
+
+            chunk["clean_text"] = clean_text_column_parallel(chunk["post_text"], pool)
+
+            # Remove short posts
+
+            chunk = chunk[chunk["clean_text"].str.len().fillna(0).to_numpy() >= 20]
 
-    df.to_csv(OUTPUT_PATH, index=False, encoding="utf-8")
+            chunk.to_csv(out, header=(i == 0), index=False)
@@ -11,19 +11,33 @@ Data Collected:
     - thread_url 
     - post_id
     - username
-    - post_date
+    - post_timestamp
     - post_text
-    
+
 """
 
 # Standard Library Imports
 import re
 import urllib.parse
+from datetime import datetime
 
 # Third-Party Imports
 import scrapy
 
 
+# Precompiled header patterns (compiled once at import, not per post)
+_DATE_RE = re.compile(r"\d{1,2}/\d{1,2}/\d{4}\s+\d{1,2}:\d{2}")
+_ID_RE = re.compile(r"#(\d+)")
+_WS_RE = re.compile(r"\s+")
+
+# Selector strings reused on every page
+_THREAD_LINKS_CSS = "a[href*='thread-view.asp?tid=']::attr(href)"
+_PAGINATION_CSS = "a[href*='bookmark=']::attr(href)"
+_POST_HEADERS_XP = "//td[@class='messageheader']"
+_POST_BODY_XP = "parent::tr/following-sibling::tr[1]"
+_USERNAME_XP = "./a[contains(@href, 'view-profile')]/text()"
+
+
 
 # Spider Class for crawling
 class AgtalkForumSpider(scrapy.Spider):
@@ -31,26 +45,80 @@ class AgtalkForumSpider(scrapy.Spider):
     # Website to scrape
     allowed_domains = ["talk.newagtalk.com"]
 
+    # Concurrency tuning so the crawl is network-bound instead of
+    # politeness-bound; AUTOTHROTTLE backs off if server latency rises
+    custom_settings = {
+        "CONCURRENT_REQUESTS": 64,
+        "CONCURRENT_REQUESTS_PER_DOMAIN": 16,
+        "DOWNLOAD_DELAY": 0.1,
+        "AUTOTHROTTLE_ENABLED": True,
+        "AUTOTHROTTLE_TARGET_CONCURRENCY": 12,
+        "REACTOR_THREADPOOL_MAXSIZE": 20,
+        "DNS_RESOLVER": "scrapy.resolver.CachingThreadedResolver",
+        # DNS cache plus gzip responses over keep-alive HTTP/1.1 connections
+        "DNSCACHE_ENABLED": True,
+        "DNSCACHE_SIZE": 10000,
+        "COMPRESSION_ENABLED": True,
+        "DOWNLOADER_MIDDLEWARES": {
+            "scrapy.downloadermiddlewares.httpcompression.HttpCompressionMiddleware": 810,
+        },
+        "DOWNLOAD_HANDLERS": {
+            "https": "scrapy.core.downloader.handlers.http11.HTTP11DownloadHandler",
+        },
+        "DEFAULT_REQUEST_HEADERS": {
+            "Accept-Encoding": "gzip, deflate",
+        },
+        # On-disk HTTP cache so re-runs skip the fetch phase and only re-parse
+        "HTTPCACHE_ENABLED": True,
+        "HTTPCACHE_STORAGE": "scrapy.extensions.httpcache.FilesystemCacheStorage",
+        "HTTPCACHE_EXPIRATION_SECS": 86400,
+        "HTTPCACHE_DIR": "httpcache",
+        "HTTPCACHE_POLICY": "scrapy.extensions.httpcache.RFC2616Policy",
+    }
+
     def start_requests(self):
-       
-        # Bookmark-based pagination step size is forum threads per page
-        for bookmark in range(0, 110000, 50):
-            url = f"https://talk.newagtalk.com/forums/forum-view.asp?fid=2&bookmark={bookmark}"
-            yield scrapy.Request(
-                url=url,
-                callback=self.parse,
-                meta={"bookmark": bookmark}
-            )
+
+        # Start from the first page only; later bookmarks are discovered
+        # from each page's pagination links instead of queued up-front
+        url = "https://talk.newagtalk.com/forums/forum-view.asp?fid=2&bookmark=0"
+        yield scrapy.Request(
+            url=url,
+            callback=self.parse,
+            meta={"bookmark": 0}
+        )
 
     # Extracting thread links from Forum Page
     def parse(self, response):
-        thread_links = response.css("a[href*='thread-view.asp?tid=']::attr(href)").getall()
+        thread_links = response.css(_THREAD_LINKS_CSS).getall()
 
         for link in thread_links:
             yield response.follow(link, callback=self.parse_thread,
                                   meta={"bookmark": response.meta.get("bookmark")}
                                 )
-            
+
+        # Following pagination to the smallest bookmark past the current
+        # page, i.e. the true next page, so no list page is skipped
+        current_bookmark = response.meta.get("bookmark", 0)
+        next_bookmark = None
+        next_url = None
+
+        for href in response.css(_PAGINATION_CSS).getall():
+            query = urllib.parse.parse_qs(urllib.parse.urlparse(href).query)
+            bookmark_value = query.get("bookmark", [None])[0]
+            if bookmark_value is None or not bookmark_value.isdigit():
+                continue
+            bookmark = int(bookmark_value)
+            if bookmark > current_bookmark and (
+                next_bookmark is None or bookmark < next_bookmark
+            ):
+                next_bookmark = bookmark
+                next_url = href
+
+        if next_url is not None:
+            yield response.follow(next_url, callback=self.parse,
+                                  meta={"bookmark": next_bookmark}
+                                )
+
     # Extracting Post data from thread page
     def parse_thread(self, response):
         parsed = urllib.parse.urlparse(response.url)
@@ -58,33 +126,45 @@ class AgtalkForumSpider(scrapy.Spider):
         thread_id =  query.get("tid", [None])[0]
         thread_title = response.css("title::text").get()
 
-        posts = response.xpath("//td[@class='messageheader']/parent::tr")
-
-        for post in posts:
-            header_text_parts = post.xpath(
-                ".//td[@class='messageheader']//span[@class='smalltext']//text()"
-            ).getall()
-            header_text = " ".join(t.strip() for t in header_text_parts if t.strip())
-
-            date_match = re.search(
-                r"\d{1,2}/\d{1,2}/\d{4}\s+\d{1,2}:\d{2}", header_text
-            )
-            post_date = date_match.group(0) if date_match else None
-            
-                
-
-            id_match = re.search(r"#(\d+)", header_text)
+        # One document-level XPath call gathers all header cells; each
+        # post's body row is reached relative to its own header so a
+        # missing body row cannot shift the pairing
+
+        headers = response.xpath(_POST_HEADERS_XP)
+
+        for header in headers:
+            # Joining text nodes with a space preserves word boundaries
+            # that the markup carries structurally (e.g. <br> line breaks)
+            header_text = _WS_RE.sub(
+                " ", " ".join(header.xpath(".//text()").getall())
+            ).strip()
+
+            # Parsing the posted date once here, so downstream consumers
+            # never re-parse the string
+            date_match = _DATE_RE.search(header_text)
+            post_ts = None
+            if date_match:
+                try:
+                    post_ts = int(
+                        datetime.strptime(
+                            date_match.group(0), "%m/%d/%Y %H:%M"
+                        ).timestamp()
+                    )
+                except ValueError:
+                    # Matched span is not a real calendar date
+                    post_ts = None
+
+            id_match = _ID_RE.search(header_text)
             post_id = id_match.group(1) if id_match else None
 
-            username = post.css(
-                'td.messageheader > a[href*="view-profile"]::text'
-            ).get()
+            username = header.xpath(_USERNAME_XP).get()
             if username:
                 username = username.strip()
 
-            body_row = post.xpath("following-sibling::tr[1]")
-            body_text_parts = body_row.xpath(".//td//text()").getall()
-            post_text = " ".join(t.strip() for t in body_text_parts if t.strip())
+            body_row = header.xpath(_POST_BODY_XP)
+            post_text = _WS_RE.sub(
+                " ", " ".join(body_row.xpath(".//text()").getall())
+            ).strip()
             # Yielding structured post record
             yield {
                 "thread_id": thread_id,
@@ -93,6 +173,6 @@ class AgtalkForumSpider(scrapy.Spider):
                 "bookmark": response.meta.get("bookmark"),
                 "post_id": post_id,
                 "username": username,
-                "post_date": post_date,
+                "post_timestamp": post_ts,
                 "post_text": post_text,
             }